@@ -10,12 +10,60 @@ System generators that build an OpenMM System object from a Topology object.
 import logging
 _logger = logging.getLogger("openmmforcefields.system_generators")
 
-from openmm import app
+import copy
+import functools
+import os
+import random
+
+import numpy as np
+
+import openmm
+from openmm import app, unit
+
+from openmmforcefields.generators.template_generators import SmallMoleculeTemplateGenerator
 
 ################################################################################
 # System generator base class
 ################################################################################
 
+# Zero torsion barrier height, precomputed so force zeroing does not allocate
+# a new Quantity per torsion
+_ZERO_K = 0.0 * unit.kilojoules_per_mole
+
+# Cache of which SmallMoleculeTemplateGenerator subclass successfully loaded each
+# small molecule force field name, so that repeated SystemGenerator construction
+# does not retry generators that are known to fail.
+_TEMPLATE_GENERATOR_CACHE = dict()
+
+@functools.lru_cache(maxsize=32)
+def _load_forcefield_from_key(key):
+    """Parse the ffxml files named in the specified cache key (see _load_forcefield)."""
+    return app.ForceField(*(name for (name, mtime) in key))
+
+def _load_forcefield(forcefields):
+    """
+    Parse the specified ffxml files into a prototype ForceField object, caching the result.
+
+    Local files are keyed on (path, mtime) so that edits on disk invalidate the
+    cached parse; packaged identifiers (e.g. 'amber/protein.ff14SB.xml') are
+    keyed on name alone.
+
+    Callers must deep-copy the returned prototype before modifying it
+    (e.g. by registering template generators), since it is shared.
+
+    Parameters
+    ----------
+    forcefields : tuple of str
+        Names of ffxml files to be parsed.
+
+    Returns
+    -------
+    forcefield : openmm.app.ForceField
+        The shared, parsed ForceField prototype.
+    """
+    key = tuple((name, os.path.getmtime(name) if os.path.isfile(name) else None) for name in forcefields)
+    return _load_forcefield_from_key(key)
+
 class classproperty(property):
     def __get__(self, obj, objtype=None):
         return super(classproperty, self).__get__(objtype)
@@ -171,10 +219,10 @@ class SystemGenerator(object):
         # Method to use for postprocessing system
         self.postprocess_system = postprocess_system
 
-        # Create OpenMM ForceField object
+        # Create OpenMM ForceField object from the shared parsed prototype,
+        # deep-copying because registerTemplateGenerator mutates the object
         forcefields = forcefields if (forcefields is not None) else list()
-        from openmm import app
-        self.forcefield = app.ForceField(*forcefields)
+        self.forcefield = copy.deepcopy(_load_forcefield(tuple(forcefields)))
 
         # Cache force fields and settings to use
         self.forcefield_kwargs = forcefield_kwargs if forcefield_kwargs is not None else dict()
@@ -188,33 +236,38 @@ class SystemGenerator(object):
                  or nonperiodic_forcefield_kwargs (if it should be applied to non-periodic systems)""")
 
         # Create and cache a residue template generator
-        from openmmforcefields.generators.template_generators import SmallMoleculeTemplateGenerator
-        self.template_generator = None
-        if small_molecule_forcefield is not None:
-            for template_generator_cls in SmallMoleculeTemplateGenerator.__subclasses__():
-                try:
-                    _logger.debug(f'Trying {template_generator_cls.__name__} to load {small_molecule_forcefield}')
-                    self.template_generator = template_generator_cls(forcefield=small_molecule_forcefield, cache=cache)
-                    break
-                except ValueError as e:
-                    _logger.debug(f'  {template_generator_cls.__name__} cannot load {small_molecule_forcefield}')
-                    _logger.debug(e)
-            if self.template_generator is None:
+        if small_molecule_forcefield is None:
+            # Bare force field: no template generator discovery or registration is needed
+            self.template_generator = None
+        else:
+            # Identify the class that can load this force field without constructing
+            # (and discarding) template generators that cannot
+            template_generator_cls = _TEMPLATE_GENERATOR_CACHE.get(small_molecule_forcefield)
+            if template_generator_cls is None:
+                for cls in SmallMoleculeTemplateGenerator.__subclasses__():
+                    if cls.can_load(small_molecule_forcefield):
+                        template_generator_cls = cls
+                        break
+            if template_generator_cls is None:
                 msg = f"No registered small molecule template generators could load force field '{small_molecule_forcefield}'\n"
                 msg += f"Available installed force fields are:\n"
-                for template_generator_cls in SmallMoleculeTemplateGenerator.__subclasses__():
-                    msg += f'  {template_generator_cls.__name__}: {template_generator_cls.INSTALLED_FORCEFIELDS}\n'
+                for cls in SmallMoleculeTemplateGenerator.__subclasses__():
+                    msg += f'  {cls.__name__}: {cls.INSTALLED_FORCEFIELDS}\n'
                 raise ValueError(msg)
+            _logger.debug(f'Using {template_generator_cls.__name__} to load {small_molecule_forcefield}')
+            self.template_generator = template_generator_cls(forcefield=small_molecule_forcefield, cache=cache)
+            _TEMPLATE_GENERATOR_CACHE[small_molecule_forcefield] = template_generator_cls
             self.forcefield.registerTemplateGenerator(self.template_generator.generator)
 
-        # Inform the template generator about any specified molecules
-        self.add_molecules(molecules)
+        # Inform the template generator about any specified molecules;
+        # still raises if molecules are provided without a template generator
+        if molecules is not None:
+            self.add_molecules(molecules)
 
     @classproperty
     def SMALL_MOLECULE_FORCEFIELDS(cls):
         """Return a listof available small molecule force fields"""
         forcefields = list()
-        from openmmforcefields.generators.template_generators import SmallMoleculeTemplateGenerator
         for template_generator_cls in SmallMoleculeTemplateGenerator.__subclasses__():
             forcefields += template_generator_cls.INSTALLED_FORCEFIELDS
         return forcefields
@@ -237,17 +290,32 @@ class SystemGenerator(object):
 
         self.template_generator.add_molecules(molecules)
 
+    def _needs_modification(self):
+        """
+        Return True if newly created System objects require post-processing
+        (barostat addition or force zeroing) by _modify_forces.
+        """
+        return (self.barostat is not None) \
+            or not (self.particle_charges and self.particle_epsilons
+                    and self.exception_charges and self.exception_epsilons
+                    and self.torsions)
+
     def _modify_forces(self, system):
         """
         Add barostat and modify forces if requested.
         """
+        # Determine which force types (if any) actually need modification
+        needs_nonbonded_modification = not (self.particle_charges and self.particle_epsilons and self.exception_charges and self.exception_epsilons)
+        needs_torsion_modification = not self.torsions
+
+        # The default configuration requires no modifications at all
+        if (self.barostat is None) and not needs_nonbonded_modification and not needs_torsion_modification:
+            return
+
         # Add barostat if requested.
         if self.barostat is not None:
-            import numpy as np
-            import openmm
-            MAXINT = np.iinfo(np.int32).max
-
-            # Determine pressure, temperature, and frequency
+            # Re-query pressure, temperature, and frequency each call, so that
+            # mutating the template barostat takes effect on the next System
             pressure = self.barostat.getDefaultPressure()
             if hasattr(self.barostat, 'getDefaultTemperature'):
                 temperature = self.barostat.getDefaultTemperature()
@@ -258,33 +326,85 @@ class SystemGenerator(object):
             # Create the barostat
             # TODO: Make sure we can support other kinds of barostats?
             barostat = openmm.MonteCarloBarostat(pressure, temperature, frequency)
-            seed = np.random.randint(MAXINT)
+            seed = random.randrange(1, 2**31 - 1) # positive 31-bit seed
             barostat.setRandomNumberSeed(seed)
             system.addForce(barostat)
 
-        # Modify forces if requested
+        # Modify forces if requested, dispatching on force type
+        handlers = dict()
+        if needs_nonbonded_modification:
+            handlers[openmm.NonbondedForce] = self._modify_nonbonded_force
+        if needs_torsion_modification:
+            handlers[openmm.PeriodicTorsionForce] = self._modify_torsion_force
+        if not handlers:
+            return
         for force in system.getForces():
-            if force.__class__.__name__ == 'NonbondedForce':
-                for index in range(force.getNumParticles()):
-                    charge, sigma, epsilon = force.getParticleParameters(index)
-                    if not self.particle_charges:
-                        charge *= 0
-                    if not self.particle_epsilons:
-                        epsilon *= 0
-                    force.setParticleParameters(index, charge, sigma, epsilon)
-                for index in range(force.getNumExceptions()):
-                    p1, p2, chargeProd, sigma, epsilon = force.getExceptionParameters(index)
-                    if not self.exception_charges:
-                        chargeProd *= 0
-                    if not self.exception_epsilons:
-                        epsilon *= 0
-                    force.setExceptionParameters(index, p1, p2, chargeProd, sigma, epsilon)
-            elif force.__class__.__name__ == 'PeriodicTorsionForce':
-                for index in range(force.getNumTorsions()):
-                    p1, p2, p3, p4, periodicity, phase, K = force.getTorsionParameters(index)
-                    if not self.torsions:
-                        K *= 0
-                    force.setTorsionParameters(index, p1, p2, p3, p4, periodicity, phase, K)
+            handler = handlers.get(type(force))
+            if handler is not None:
+                handler(force)
+
+    def _modify_nonbonded_force(self, force):
+        """
+        Zero out particle and/or exception charges and epsilons in the specified NonbondedForce as requested.
+
+        All parameters are read into arrays up front, zero-masks are applied in NumPy
+        in one shot, and both parameter sets are written back together, so the data
+        movement happens in grouped read and write passes.
+        """
+        modify_particles = not (self.particle_charges and self.particle_epsilons)
+        modify_exceptions = not (self.exception_charges and self.exception_epsilons)
+
+        # Read all parameters that will be modified
+        # Parameters are already stored in the OpenMM MD unit system,
+        # so strip the raw values rather than performing unit conversions
+        if modify_particles:
+            num_particles = force.getNumParticles()
+            charges = np.empty(num_particles)
+            sigmas = np.empty(num_particles)
+            epsilons = np.empty(num_particles)
+            for index in range(num_particles):
+                charges[index], sigmas[index], epsilons[index] = (quantity._value for quantity in force.getParticleParameters(index))
+        if modify_exceptions:
+            num_exceptions = force.getNumExceptions()
+            particle1 = np.empty(num_exceptions, dtype=np.int32)
+            particle2 = np.empty(num_exceptions, dtype=np.int32)
+            chargeprods = np.empty(num_exceptions)
+            exception_sigmas = np.empty(num_exceptions)
+            exception_epsilons = np.empty(num_exceptions)
+            for index in range(num_exceptions):
+                p1, p2, chargeProd, sigma, epsilon = force.getExceptionParameters(index)
+                particle1[index] = p1
+                particle2[index] = p2
+                chargeprods[index] = chargeProd._value
+                exception_sigmas[index] = sigma._value
+                exception_epsilons[index] = epsilon._value
+
+        # Apply the requested zero-masks
+        if not self.particle_charges:
+            charges.fill(0.0)
+        if not self.particle_epsilons:
+            epsilons.fill(0.0)
+        if not self.exception_charges:
+            chargeprods.fill(0.0)
+        if not self.exception_epsilons:
+            exception_epsilons.fill(0.0)
+
+        # Write everything back
+        # Raw floats are interpreted in the OpenMM MD unit system, avoiding Quantity construction
+        if modify_particles:
+            for index in range(num_particles):
+                force.setParticleParameters(index, charges[index], sigmas[index], epsilons[index])
+        if modify_exceptions:
+            for index in range(num_exceptions):
+                force.setExceptionParameters(index, int(particle1[index]), int(particle2[index]), chargeprods[index], exception_sigmas[index], exception_epsilons[index])
+
+    def _modify_torsion_force(self, force):
+        """
+        Zero out torsion barrier heights in the specified PeriodicTorsionForce as requested.
+        """
+        for index in range(force.getNumTorsions()):
+            p1, p2, p3, p4, periodicity, phase, K = force.getTorsionParameters(index)
+            force.setTorsionParameters(index, p1, p2, p3, p4, periodicity, phase, _ZERO_K)
 
     def create_system(self, topology, molecules=None):
         """
@@ -312,8 +432,8 @@ class SystemGenerator(object):
         if (self.template_generator is not None) and (molecules is not None):
             self.template_generator.add_molecules(molecules)
 
-        # Build the kwargs to use
-        import copy
+        # Build the kwargs to use, rebuilding the merge each call so that
+        # in-place modification of the kwargs dicts is always honored
         forcefield_kwargs = copy.deepcopy(self.forcefield_kwargs)
         if topology.getPeriodicBoxVectors() is None:
             forcefield_kwargs.update(self.nonperiodic_forcefield_kwargs)
@@ -323,8 +443,10 @@ class SystemGenerator(object):
         # Build the System
         system = self.forcefield.createSystem(topology, **forcefield_kwargs)
 
-        # Modify other forces as requested
-        self._modify_forces(system)
+        # Modify other forces as requested; in the default configuration
+        # no modifications are needed and the call is skipped entirely
+        if self._needs_modification():
+            self._modify_forces(system)
 
         # Post-process the System if requested
         if self.postprocess_system is not None:
@@ -332,10 +454,172 @@ class SystemGenerator(object):
 
         return system
 
+    def create_systems(self, topologies, molecules=None):
+        """
+        Create a System for each of the specified topologies.
+
+        Molecules are registered with the template generator once, up front
+        (deduplicated by SMILES), so templates shared between topologies are
+        only parameterized a single time.
+
+        Systems are created sequentially: the TinyDB template cache has no
+        inter-process locking, so callers parallelizing system creation across
+        processes must not share a ``cache`` file between workers.
+
+        Parameters
+        ----------
+        topologies : list of openmm.app.Topology
+            The topologies describing the systems to be created
+        molecules : openff.toolkit.topology.Molecule or list of Molecules, optional, default=None
+            Can alternatively be an object (such as an OpenEye OEMol or RDKit Mol or SMILES string) that can be used to construct a Molecule.
+            Can also be a list of Molecule objects or objects that can be used to construct a Molecule.
+            If specified, these molecules will be recognized and parameterized as needed.
+            The parameters will be cached in case they are encountered again the future.
+
+        Returns
+        -------
+        systems : list of openmm.System
+            One System per topology, in the same order
+
+        """
+        # Inform the template generator about any specified molecules;
+        # add_molecules deduplicates them by SMILES
+        if (self.template_generator is not None) and (molecules is not None):
+            self.template_generator.add_molecules(molecules)
+
+        return [ self.create_system(topology) for topology in topologies ]
+
 ################################################################################
 # Dummy system generator
 ################################################################################
 
+def _bond_adjacency(bonds, n_atoms):
+    """
+    Build a CSR-style adjacency of which atom indices are bonded to each atom.
+
+    Parameters
+    ----------
+    bonds : np.ndarray of np.int32 with shape (n_bonds, 2)
+        Atom index pairs for each bond
+    n_atoms : int
+        Total number of atoms
+
+    Returns
+    -------
+    neighbors_start : np.ndarray of np.int32 with shape (n_atoms+1,)
+        CSR offsets: the neighbors of atom i are neighbors[neighbors_start[i]:neighbors_start[i+1]]
+    neighbors : np.ndarray of np.int32
+        CSR neighbor atom indices
+    """
+    neighbors_start = np.zeros(n_atoms + 1, dtype=np.int32)
+    np.add.at(neighbors_start[1:], bonds.ravel(), 1)
+    np.cumsum(neighbors_start, out=neighbors_start)
+    neighbors = np.empty(neighbors_start[-1], dtype=np.int32)
+    fill_position = neighbors_start[:-1].copy()
+    for atom1, atom2 in bonds:
+        neighbors[fill_position[atom1]] = atom2
+        fill_position[atom1] += 1
+        neighbors[fill_position[atom2]] = atom1
+        fill_position[atom2] += 1
+    return neighbors_start, neighbors
+
+def _enumerate_angles(neighbors_start, neighbors):
+    """
+    Enumerate all unique angles from a CSR-style bond adjacency.
+
+    Parameters
+    ----------
+    neighbors_start : np.ndarray of np.int32 with shape (n_atoms+1,)
+        CSR offsets: the neighbors of atom i are neighbors[neighbors_start[i]:neighbors_start[i+1]]
+    neighbors : np.ndarray of np.int32
+        CSR neighbor atom indices
+
+    Returns
+    -------
+    angles : np.ndarray of np.int32 with shape (n_angles, 3)
+        Atom index triples (atom1, atom2, atom3) with atom2 central and atom1 < atom3
+    """
+    n_atoms = neighbors_start.shape[0] - 1
+    n_angles = 0
+    for atom2 in range(n_atoms):
+        degree = neighbors_start[atom2+1] - neighbors_start[atom2]
+        n_angles += (degree * (degree - 1)) // 2
+    angles = np.empty((n_angles, 3), dtype=np.int32)
+    index = 0
+    for atom2 in range(n_atoms):
+        start = neighbors_start[atom2]
+        end = neighbors_start[atom2+1]
+        for i in range(start, end):
+            for j in range(i+1, end):
+                atom1 = neighbors[i]
+                atom3 = neighbors[j]
+                if atom1 > atom3:
+                    atom1, atom3 = atom3, atom1
+                angles[index, 0] = atom1
+                angles[index, 1] = atom2
+                angles[index, 2] = atom3
+                index += 1
+    return angles
+
+def _enumerate_torsions(bonds, neighbors_start, neighbors):
+    """
+    Enumerate all unique proper torsions from a CSR-style bond adjacency.
+
+    Parameters
+    ----------
+    bonds : np.ndarray of np.int32 with shape (n_bonds, 2)
+        Atom index pairs for each bond
+    neighbors_start : np.ndarray of np.int32 with shape (n_atoms+1,)
+        CSR offsets: the neighbors of atom i are neighbors[neighbors_start[i]:neighbors_start[i+1]]
+    neighbors : np.ndarray of np.int32
+        CSR neighbor atom indices
+
+    Returns
+    -------
+    torsions : np.ndarray of np.int32 with shape (n_torsions, 4)
+        Atom index quadruples (atom1, atom2, atom3, atom4) with atom2-atom3 the central bond and atom1 < atom4
+    """
+    n_bonds = bonds.shape[0]
+    max_torsions = 0
+    for b in range(n_bonds):
+        degree2 = neighbors_start[bonds[b, 0]+1] - neighbors_start[bonds[b, 0]]
+        degree3 = neighbors_start[bonds[b, 1]+1] - neighbors_start[bonds[b, 1]]
+        max_torsions += (degree2 - 1) * (degree3 - 1)
+    torsions = np.empty((max_torsions, 4), dtype=np.int32)
+    index = 0
+    for b in range(n_bonds):
+        atom2 = bonds[b, 0]
+        atom3 = bonds[b, 1]
+        for i in range(neighbors_start[atom2], neighbors_start[atom2+1]):
+            atom1 = neighbors[i]
+            if atom1 == atom3:
+                continue
+            for j in range(neighbors_start[atom3], neighbors_start[atom3+1]):
+                atom4 = neighbors[j]
+                if (atom4 == atom2) or (atom4 == atom1):
+                    continue
+                if atom1 < atom4:
+                    torsions[index, 0] = atom1
+                    torsions[index, 1] = atom2
+                    torsions[index, 2] = atom3
+                    torsions[index, 3] = atom4
+                else:
+                    torsions[index, 0] = atom4
+                    torsions[index, 1] = atom3
+                    torsions[index, 2] = atom2
+                    torsions[index, 3] = atom1
+                index += 1
+    return torsions[:index]
+
+# JIT-compile the enumeration loops if numba is available; the functions are
+# written to run identically as plain Python if it is not
+try:
+    import numba
+    _enumerate_angles = numba.njit(cache=True)(_enumerate_angles)
+    _enumerate_torsions = numba.njit(cache=True)(_enumerate_torsions)
+except ImportError:
+    pass
+
 class DummySystemGenerator(SystemGenerator):
     """
     Dummy force field that can add basic parameters to any system for testing purposes.
@@ -375,84 +659,60 @@ class DummySystemGenerator(SystemGenerator):
         # Create a System
         system = openmm.System()
 
-        # Add particles
-        mass = 12.0 * unit.amu
-        for atom in topology.atoms:
-            system.addParticle(mass)
-
         # Add simple repulsive interactions
         # TODO: Use softcore repulsive interaction; Gaussian times switch?
         nonbonded = openmm.CustomNonbondedForce('100/(r/0.1)^4')
         nonbonded.setNonbondedMethod(openmm.CustomNonbondedForce.CutoffNonPeriodic);
         nonbonded.setCutoffDistance(1*unit.nanometer)
         system.addForce(nonbonded)
-        for atom in topology.atoms:
-            nonbonded.addParticle([])
-
-        # Build a list of which atom indices are bonded to each atom
-        bondedToAtom = []
-        for atom in topology.atoms():
-            bondedToAtom.append(set())
-        for (atom1, atom2) in topology.bonds():
-            bondedToAtom[atom1.index].add(atom2.index)
-            bondedToAtom[atom2.index].add(atom1.index)
-        return bondedToAtom
+
+        # Add particles to the System and the nonbonded force in a single pass,
+        # binding the bound methods locally to avoid per-iteration attribute lookups;
+        # only the atom count is needed, so avoid walking the atom generator at all
+        mass = 12.0 * unit.amu
+        n_atoms = topology.getNumAtoms()
+        add_system_particle = system.addParticle
+        add_nonbonded_particle = nonbonded.addParticle
+        for index in range(n_atoms):
+            add_system_particle(mass)
+            add_nonbonded_particle([])
+
+        # Collect bonds (as atom indices) into an array in a single topology pass
+        # and build the CSR-style adjacency
+        bonds = np.array([ (atom1.index, atom2.index) for (atom1, atom2) in topology.bonds() ], dtype=np.int32).reshape(-1, 2)
+        neighbors_start, neighbors = _bond_adjacency(bonds, n_atoms)
 
         # Add bonds
         bond_force = openmm.HarmonicBondForce()
         r0 = 1.0 * unit.angstroms
         sigma_r = 0.1 * unit.angstroms
         Kr = kT / sigma_r**2
-        for atom1, atom2 in topology.bonds():
-            bond_force.addBond(atom1.index, atom2.index, r0, Kr)
+        for atom1, atom2 in bonds:
+            bond_force.addBond(int(atom1), int(atom2), r0, Kr)
         system.addForce(bond_force)
 
-        # Add angles
-        uniqueAngles = set()
-        for bond in topology.bonds():
-            for atom in bondedToAtom[bond.atom1]:
-                if atom != bond.atom2:
-                    if atom < bond.atom2:
-                        uniqueAngles.add((atom, bond.atom1, bond.atom2))
-                    else:
-                        uniqueAngles.add((bond.atom2, bond.atom1, atom))
-            for atom in bondedToAtom[bond.atom2]:
-                if atom != bond.atom1:
-                    if atom > bond.atom1:
-                        uniqueAngles.add((bond.atom1, bond.atom2, atom))
-                    else:
-                        uniqueAngles.add((atom, bond.atom2, bond.atom1))
-        angles = sorted(list(uniqueAngles))
+        # Add angles: each unique angle is a distinct central atom with an ordered pair of its neighbors
+        # Rows are already canonicalized (atom1 < atom3); np.unique sorts them
+        # lexicographically and collapses duplicates arising from any duplicate
+        # bond records in the topology
+        angles = np.unique(_enumerate_angles(neighbors_start, neighbors), axis=0)
         theta0 = 109.5 * unit.degrees # TODO: Adapt based on number of bonds to each atom?
         sigma_theta = 10 * unit.degrees
         Ktheta = kT / sigma_theta**2
         angle_force = openmm.HarmonicAngleForce()
         for (atom1, atom2, atom3) in angles:
-            angles.addAngle(atom1.index, atom2.index, atom3.index, theta0, Ktheta)
+            angle_force.addAngle(int(atom1), int(atom2), int(atom3), theta0, Ktheta)
         system.addForce(angle_force)
 
-        # Make a list of all unique proper torsions
-        uniquePropers = set()
-        for angle in angles:
-            for atom in bondedToAtom[angle[0]]:
-                if atom not in angle:
-                    if atom < angle[2]:
-                        uniquePropers.add((atom, angle[0], angle[1], angle[2]))
-                    else:
-                        uniquePropers.add((angle[2], angle[1], angle[0], atom))
-            for atom in bondedToAtom[angle[2]]:
-                if atom not in angle:
-                    if atom > angle[0]:
-                        uniquePropers.add((angle[0], angle[1], angle[2], atom))
-                    else:
-                        uniquePropers.add((atom, angle[2], angle[1], angle[0]))
-        propers = sorted(list(uniquePropers))
+        # Add proper torsions: each unique proper has a distinct central bond,
+        # extended by one neighbor on each side
+        propers = np.unique(_enumerate_torsions(bonds, neighbors_start, neighbors), axis=0)
         torsion_force = openmm.PeriodicTorsionForce()
         periodicity = 3
         phase = 0.0 * unit.degrees
         Kphi = 0.0 * kT
         for (atom1, atom2, atom3, atom4) in propers:
-            torsion_force.add_torsion(atom1.index, atom2.index, atom3.index, atom4.index, periodicity, phase, Kphi)
+            torsion_force.addTorsion(int(atom1), int(atom2), int(atom3), int(atom4), periodicity, phase, Kphi)
         system.addForce(torsion_force)
 
         return system
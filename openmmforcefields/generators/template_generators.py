@@ -20,6 +20,12 @@ _logger = logging.getLogger("openmmforcefields.generators.template_generators")
 # Small molecule OpenMM ForceField template generation utilities
 ################################################################################
 
+# Process-wide registry of parsed cache-file entries, keyed on
+# (absolute cache path, table name) and invalidated when the file's
+# modification time changes, so that template generators sharing a cache
+# file do not re-read and re-parse the JSON on every template generation.
+_CACHE_FILE_REGISTRY = dict()
+
 class SmallMoleculeTemplateGenerator(object):
     """
     Abstract base class for small molecule template generation for OpenMM ForceField.
@@ -70,6 +76,25 @@ class SmallMoleculeTemplateGenerator(object):
         """The current force field name in use"""
         return self._forcefield
 
+    @classmethod
+    def can_load(cls, forcefield):
+        """
+        Check whether this template generator supports the specified force field name, without doing any I/O.
+
+        Subclasses with more permissive constructors (e.g. accepting local files) should override this.
+
+        Parameters
+        ----------
+        forcefield : str
+            The force field name to check
+
+        Returns
+        -------
+        can_load : bool
+            True if this generator can load the specified force field
+        """
+        return forcefield in cls.INSTALLED_FORCEFIELDS
+
     @contextlib.contextmanager
     def _open_db(self):
         """Open the cache database.
@@ -82,6 +107,33 @@ class SmallMoleculeTemplateGenerator(object):
         finally:
             db.close()
 
+    def _cached_db_entries(self):
+        """
+        Return the cached template records for this generator's force field table.
+
+        Parsed records are shared process-wide, keyed on the cache filename and
+        table name, and re-read from disk only when the cache file's
+        modification time changes (e.g. after a new template has been written).
+
+        Returns
+        -------
+        entries : list of dict
+            Records from the cache database table, each holding 'smiles' and 'ffxml' keys
+        """
+        key = (os.path.abspath(self._cache), self._database_table_name)
+        try:
+            mtime = os.path.getmtime(self._cache)
+        except OSError:
+            mtime = None # cache file has not been created yet
+        cached = _CACHE_FILE_REGISTRY.get(key)
+        if (cached is not None) and (cached[0] == mtime):
+            return cached[1]
+        with self._open_db() as db:
+            table = db.table(self._database_table_name)
+            entries = [ dict(entry) for entry in table ]
+        _CACHE_FILE_REGISTRY[key] = (mtime, entries)
+        return entries
+
     def add_molecules(self, molecules=None):
         """
         Add specified list of Molecule objects to cached molecules that will be recognized.
@@ -271,30 +323,28 @@ class SmallMoleculeTemplateGenerator(object):
 
         # If a database is specified, check against molecules in the database
         if self._cache is not None:
-            with self._open_db() as db:
-                table = db.table(self._database_table_name)
-                for entry in table:
-                    # Skip any molecules we've added to the database this session
-                    if entry['smiles'] in self._smiles_added_to_db:
-                        continue
-
-                    # See if the template matches
-                    from openff.toolkit.topology import Molecule
-                    molecule_template = Molecule.from_smiles(entry['smiles'], allow_undefined_stereo=True)
-                    _logger.debug(f"Checking against {entry['smiles']}")
-                    if self._match_residue(residue, molecule_template):
-                        ffxml_contents = entry['ffxml']
-
-                        # Write to debug file if requested
-                        if self.debug_ffxml_filename is not None:
-                            with open(self.debug_ffxml_filename, 'w') as outfile:
-                                _logger.debug(f'writing ffxml to {self.debug_ffxml_filename}')
-                                outfile.write(ffxml_contents)
-
-                        # Add parameters and residue template for this residue
-                        forcefield.loadFile(StringIO(ffxml_contents))
-                        # Signal success
-                        return True
+            for entry in self._cached_db_entries():
+                # Skip any molecules we've added to the database this session
+                if entry['smiles'] in self._smiles_added_to_db:
+                    continue
+
+                # See if the template matches
+                from openff.toolkit.topology import Molecule
+                molecule_template = Molecule.from_smiles(entry['smiles'], allow_undefined_stereo=True)
+                _logger.debug(f"Checking against {entry['smiles']}")
+                if self._match_residue(residue, molecule_template):
+                    ffxml_contents = entry['ffxml']
+
+                    # Write to debug file if requested
+                    if self.debug_ffxml_filename is not None:
+                        with open(self.debug_ffxml_filename, 'w') as outfile:
+                            _logger.debug(f'writing ffxml to {self.debug_ffxml_filename}')
+                            outfile.write(ffxml_contents)
+
+                    # Add parameters and residue template for this residue
+                    forcefield.loadFile(StringIO(ffxml_contents))
+                    # Signal success
+                    return True
 
         # Check against the molecules we know about
         for smiles, molecule in self._molecules.items():
@@ -1258,6 +1308,29 @@ class SMIRNOFFTemplateGenerator(SmallMoleculeTemplateGenerator,OpenMMSystemMixin
 
         return file_names
 
+    @classmethod
+    def can_load(cls, forcefield):
+        """
+        Check whether this template generator supports the specified force field name.
+
+        Parameters
+        ----------
+        forcefield : str
+            Name of installed SMIRNOFF force field (without .offxml) or local .offxml filename (with extension)
+
+        Returns
+        -------
+        can_load : bool
+            True if this generator can load the specified force field
+        """
+        # Local .offxml files are loaded directly
+        if forcefield.endswith('.offxml'):
+            return True
+        # Otherwise the name (plus .offxml) must be installed; unlike INSTALLED_FORCEFIELDS,
+        # do not exclude '_unconstrained' variants here
+        from openff.toolkit.typing.engines.smirnoff import get_available_force_fields
+        return (forcefield + '.offxml') in get_available_force_fields(full_paths=False)
+
     def _search_paths(self, filename):
         """Search registered OpenFF plugin directories
 
@@ -1516,6 +1589,33 @@ class EspalomaTemplateGenerator(SmallMoleculeTemplateGenerator,OpenMMSystemMixin
         # TODO: Maybe we can check ~/.espaloma and ESPALOMA_PATH?
         return ['espaloma-0.2.2']
 
+    @classmethod
+    def can_load(cls, forcefield):
+        """
+        Check whether this template generator supports the specified force field name.
+
+        Parameters
+        ----------
+        forcefield : str
+            Name of the espaloma release (e.g. 'espaloma-0.2.2'), local .pt filepath, or URL
+
+        Returns
+        -------
+        can_load : bool
+            True if this generator can load the specified force field
+        """
+        import re
+        if re.match('espaloma-(\d+\.\d+\.\d+)', forcefield):
+            return True
+        # Local filepaths and URLs to .pt model parameters are also accepted
+        if os.path.exists(forcefield):
+            return True
+        try:
+            import validators
+        except ImportError:
+            return False
+        return bool(validators.url(forcefield))
+
     def _get_model_filepath(self, forcefield):
         """Retrieve local file path to cached espaloma model parameters, or retrieve remote model if needed.
 
@@ -323,6 +323,26 @@ class TestSystemGenerator(unittest.TestCase):
                     # Specify molecules during system creation
                     system = generator.create_system(openmm_topology, molecules=molecules)
 
+    def test_create_systems(self):
+        """Test that SystemGenerator can create Systems for a batch of topologies"""
+        from openmmforcefields.generators import SystemGenerator
+
+        for name, testsystem in self.testsystems.items():
+            molecules = testsystem['molecules']
+
+            SMALL_MOLECULE_FORCEFIELDS = SystemGenerator.SMALL_MOLECULE_FORCEFIELDS if not CI else ['gaff-2.11', 'openff-2.0.0', 'espaloma-0.2.2']
+            for small_molecule_forcefield in SMALL_MOLECULE_FORCEFIELDS:
+                # Create a SystemGenerator for this force field
+                generator = SystemGenerator(forcefields=self.amber_forcefields,
+                                                small_molecule_forcefield=small_molecule_forcefield)
+
+                # Create Systems for all molecule topologies in one batch
+                topologies = [ molecule.to_topology().to_openmm() for molecule in molecules ]
+                systems = generator.create_systems(topologies, molecules=molecules)
+                assert len(systems) == len(topologies)
+                for molecule, system in zip(molecules, systems):
+                    assert system.getNumParticles() == molecule.n_atoms
+
     def test_add_molecules(self):
         """Test that Molecules can be added to SystemGenerator later"""
         from openmmforcefields.generators import SystemGenerator
@@ -435,3 +455,111 @@ class TestSystemGenerator(unittest.TestCase):
 
             with open('test.pdb', 'w') as outfile:
                 app.PDBFile.writeFile(modeller.topology, modeller.positions, outfile)
+
+################################################################################
+# DummySystemGenerator tests
+################################################################################
+
+class TestDummySystemGenerator(unittest.TestCase):
+    """Tests for DummySystemGenerator and its angle/torsion enumeration."""
+
+    # Test bond graphs: (name, n_atoms, bond list)
+    bond_graphs = [
+        ('3-ring', 3, [(0,1), (1,2), (2,0)]),
+        ('4-ring', 4, [(0,1), (1,2), (2,3), (3,0)]),
+        ('5-ring', 5, [(0,1), (1,2), (2,3), (3,4), (4,0)]),
+        ('chain', 6, [(0,1), (1,2), (2,3), (3,4), (4,5)]),
+        ('star', 5, [(0,1), (0,2), (0,3), (0,4)]),
+        ('neopentane-like', 5, [(1,0), (2,0), (3,0), (4,0)]),
+        ('disconnected', 5, [(0,1), (3,4)]),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        # Add some random connected graphs to the test set
+        import random
+        rng = random.Random(2023)
+        for trial in range(5):
+            n_atoms = rng.randint(5, 20)
+            candidate_bonds = [ (i, j) for i in range(n_atoms) for j in range(i+1, n_atoms) ]
+            bonds = rng.sample(candidate_bonds, rng.randint(n_atoms-1, min(2*n_atoms, len(candidate_bonds))))
+            cls.bond_graphs = cls.bond_graphs + [ (f'random-{trial}', n_atoms, bonds) ]
+
+    @staticmethod
+    def reference_angles_and_torsions(bonds, n_atoms):
+        """Brute-force reference enumeration of unique angles and proper torsions from a bond list."""
+        neighbors = [ set() for index in range(n_atoms) ]
+        for (atom1, atom2) in bonds:
+            neighbors[atom1].add(atom2)
+            neighbors[atom2].add(atom1)
+        angles = set()
+        for atom2 in range(n_atoms):
+            for atom1 in neighbors[atom2]:
+                for atom3 in neighbors[atom2]:
+                    if atom1 < atom3:
+                        angles.add((atom1, atom2, atom3))
+        torsions = set()
+        for (atom2, atom3) in bonds:
+            for atom1 in neighbors[atom2] - {atom3}:
+                for atom4 in neighbors[atom3] - {atom2, atom1}:
+                    if atom1 < atom4:
+                        torsions.add((atom1, atom2, atom3, atom4))
+                    else:
+                        torsions.add((atom4, atom3, atom2, atom1))
+        return angles, torsions
+
+    def test_enumeration_matches_reference(self):
+        """Test CSR-based angle/torsion enumeration against a brute-force reference"""
+        import numpy as np
+        from openmmforcefields.generators.system_generators import _bond_adjacency, _enumerate_angles, _enumerate_torsions
+        for name, n_atoms, bonds in self.bond_graphs:
+            bond_array = np.array(bonds, dtype=np.int32).reshape(-1, 2)
+            neighbors_start, neighbors = _bond_adjacency(bond_array, n_atoms)
+            angles = np.unique(_enumerate_angles(neighbors_start, neighbors), axis=0)
+            torsions = np.unique(_enumerate_torsions(bond_array, neighbors_start, neighbors), axis=0)
+            reference_angles, reference_torsions = self.reference_angles_and_torsions(bonds, n_atoms)
+            assert set(map(tuple, angles)) == reference_angles, f'angle mismatch for {name}'
+            assert len(angles) == len(reference_angles), f'duplicate angles for {name}'
+            assert set(map(tuple, torsions)) == reference_torsions, f'torsion mismatch for {name}'
+            assert len(torsions) == len(reference_torsions), f'duplicate torsions for {name}'
+
+    def test_enumeration_jit_compiled(self):
+        """Test that the enumeration functions are numba-compiled when numba is available"""
+        pytest.importorskip('numba')
+        import numpy as np
+        from openmmforcefields.generators.system_generators import _bond_adjacency, _enumerate_angles, _enumerate_torsions
+        # njit dispatchers expose the original Python function as py_func
+        assert hasattr(_enumerate_angles, 'py_func')
+        assert hasattr(_enumerate_torsions, 'py_func')
+        # Force nopython-mode compilation and check against the pure-Python implementations
+        bonds = np.array([(0,1), (1,2), (2,3), (1,4)], dtype=np.int32)
+        neighbors_start, neighbors = _bond_adjacency(bonds, 5)
+        angles = _enumerate_angles(neighbors_start, neighbors)
+        torsions = _enumerate_torsions(bonds, neighbors_start, neighbors)
+        assert (angles == _enumerate_angles.py_func(neighbors_start, neighbors)).all()
+        assert (torsions == _enumerate_torsions.py_func(bonds, neighbors_start, neighbors)).all()
+
+    def test_create_system(self):
+        """Test DummySystemGenerator System creation from a simple Topology"""
+        pytest.importorskip('openmmtools')
+        from openmm import app
+        from openmm.app.element import carbon
+        from openmmforcefields.generators.system_generators import DummySystemGenerator
+
+        # Build a branched pentane-like topology: a 4-atom chain with a branch on atom 1
+        topology = app.Topology()
+        chain = topology.addChain()
+        residue = topology.addResidue('MOL', chain)
+        atoms = [ topology.addAtom(f'C{index}', carbon, residue) for index in range(5) ]
+        for (index1, index2) in [(0,1), (1,2), (2,3), (1,4)]:
+            topology.addBond(atoms[index1], atoms[index2])
+
+        generator = DummySystemGenerator(small_molecule_forcefield=None)
+        system = generator.create_system(topology)
+
+        assert system.getNumParticles() == 5
+        forces = { force.__class__.__name__ : force for force in system.getForces() }
+        assert forces['CustomNonbondedForce'].getNumParticles() == 5
+        assert forces['HarmonicBondForce'].getNumBonds() == 4
+        assert forces['HarmonicAngleForce'].getNumAngles() == 4
+        assert forces['PeriodicTorsionForce'].getNumTorsions() == 2
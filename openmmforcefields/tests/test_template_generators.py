@@ -78,6 +78,19 @@ class TestGAFFTemplateGenerator(unittest.TestCase):
             assert generator.gaff_xml_filename.endswith(forcefield + '.xml')
             assert os.path.exists(generator.gaff_xml_filename)
 
+    def test_can_load(self):
+        """Test that can_load agrees with the constructor's acceptance rules"""
+        # Every installed force field must be accepted by both can_load and the constructor
+        for forcefield in GAFFTemplateGenerator.INSTALLED_FORCEFIELDS:
+            assert GAFFTemplateGenerator.can_load(forcefield)
+            generator = GAFFTemplateGenerator(forcefield=forcefield)
+            assert generator.forcefield == forcefield
+        # Force fields belonging to other generators must be rejected by both
+        for forcefield in ['openff-2.0.0', 'espaloma-0.2.2', 'not-a-forcefield-0.0.0']:
+            assert not GAFFTemplateGenerator.can_load(forcefield)
+            with self.assertRaises(ValueError):
+                GAFFTemplateGenerator(forcefield=forcefield)
+
     def test_create(self):
         """Test template generator creation"""
         # Create an empty generator
@@ -785,6 +798,21 @@ class TestSMIRNOFFTemplateGenerator(TestGAFFTemplateGenerator):
             assert generator.smirnoff_filename.endswith(forcefield + '.offxml')
             assert os.path.exists(generator.smirnoff_filename)
 
+    def test_can_load(self):
+        """Test that can_load agrees with the constructor's acceptance rules"""
+        # Every installed force field must be accepted by both can_load and the constructor
+        for forcefield in SMIRNOFFTemplateGenerator.INSTALLED_FORCEFIELDS:
+            assert SMIRNOFFTemplateGenerator.can_load(forcefield)
+            generator = SMIRNOFFTemplateGenerator(forcefield=forcefield)
+            assert generator.forcefield == forcefield
+        # Local .offxml files in the SMIRNOFF specification are accepted without validation
+        assert SMIRNOFFTemplateGenerator.can_load('mysmirnoff.offxml')
+        # Force fields belonging to other generators must be rejected by both
+        for forcefield in ['gaff-2.11', 'espaloma-0.2.2', 'not-a-forcefield-0.0.0']:
+            assert not SMIRNOFFTemplateGenerator.can_load(forcefield)
+            with self.assertRaises(ValueError):
+                SMIRNOFFTemplateGenerator(forcefield=forcefield)
+
 
 class TestEspalomaTemplateGenerator(TestGAFFTemplateGenerator):
     TEMPLATE_GENERATOR = EspalomaTemplateGenerator
@@ -956,6 +984,22 @@ class TestEspalomaTemplateGenerator(TestGAFFTemplateGenerator):
             generator = EspalomaTemplateGenerator(forcefield=filename)
             del generator
 
+    def test_can_load(self):
+        """Test that can_load agrees with the constructor's acceptance rules"""
+        # Every installed force field must be accepted by both can_load and the constructor
+        for forcefield in EspalomaTemplateGenerator.INSTALLED_FORCEFIELDS:
+            assert EspalomaTemplateGenerator.can_load(forcefield)
+            generator = EspalomaTemplateGenerator(forcefield=forcefield)
+            assert generator.forcefield == forcefield
+        # Versioned release names, URLs, and local filepaths are accepted (see test_retrieve_forcefields)
+        assert EspalomaTemplateGenerator.can_load('espaloma-0.2.2')
+        assert EspalomaTemplateGenerator.can_load('https://github.com/choderalab/espaloma/releases/download/0.2.2/espaloma-0.2.2.pt')
+        # Force fields belonging to other generators must be rejected by both
+        for forcefield in ['gaff-2.11', 'openff-2.0.0', 'not-a-forcefield-0.0.0']:
+            assert not EspalomaTemplateGenerator.can_load(forcefield)
+            with self.assertRaises(ValueError):
+                EspalomaTemplateGenerator(forcefield=forcefield)
+
     def test_energies(self):
         """Test potential energies match between openff-toolkit and OpenMM ForceField"""
         # DEBUG